@@ -33,14 +33,14 @@ class ProxyManager:
                     if 'id' in proxy_config and 'http' in proxy_config:
                         self.proxies[proxy_config['id']] = proxy_config
                 
-                logger.info(f"Loaded {len(self.proxies)} proxies from config file")
+                logger.info("Loaded %d proxies from config file", len(self.proxies))
                 return True
             else:
                 logger.error("Invalid proxy configuration format")
                 return False
                 
         except Exception as e:
-            logger.error(f"Error loading proxy configuration: {str(e)}")
+            logger.error("Error loading proxy configuration: %s", e)
             return False
     
     def save_config(self, config_file: Optional[str] = None) -> bool:
@@ -59,11 +59,11 @@ class ProxyManager:
             with open(config_file, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2)
                 
-            logger.info(f"Saved proxy configuration to {config_file}")
+            logger.info("Saved proxy configuration to %s", config_file)
             return True
             
         except Exception as e:
-            logger.error(f"Error saving proxy configuration: {str(e)}")
+            logger.error("Error saving proxy configuration: %s", e)
             return False
     
     def add_proxy(self, proxy_id: str, http_proxy: str, https_proxy: Optional[str] = None, 
@@ -84,20 +84,20 @@ class ProxyManager:
             proxy_config['password'] = password
             
         self.proxies[proxy_id] = proxy_config
-        logger.info(f"Added proxy: {proxy_id}")
+        logger.info("Added proxy: %s", proxy_id)
         return True
     
     def remove_proxy(self, proxy_id: str) -> bool:
         if proxy_id in self.proxies:
             del self.proxies[proxy_id]
-            logger.info(f"Removed proxy: {proxy_id}")
+            logger.info("Removed proxy: %s", proxy_id)
             
             if self.current_proxy and self.current_proxy.get('id') == proxy_id:
                 self.current_proxy = None
                 
             return True
         else:
-            logger.warning(f"Proxy not found: {proxy_id}")
+            logger.warning("Proxy not found: %s", proxy_id)
             return False
     
     def get_proxy_list(self) -> List[Dict[str, Any]]:
@@ -124,7 +124,7 @@ class ProxyManager:
         self.current_proxy = proxy_config
         self.current_proxy['formatted'] = proxy_dict
         
-        logger.info(f"Selected proxy: {proxy_id}")
+        logger.info("Selected proxy: %s", proxy_id)
         return proxy_dict
     
     def get_current_proxy(self) -> Optional[Dict[str, str]]:
@@ -244,7 +244,7 @@ class ProxyManager:
             return proxy_settings
                 
         except (ImportError, OSError) as e:
-            logger.error(f"Error detecting Windows proxy settings: {str(e)}")
+            logger.error("Error detecting Windows proxy settings: %s", e)
             return None
 
 if __name__ == "__main__":
@@ -1,22 +1,29 @@
 import speech_recognition as sr
 import json
-import os
-import sys
-from langdetect import detect, DetectorFactory
 import requests
-import base64
-import tempfile
-import uuid
-from pydub import AudioSegment
-import io
-import numpy as np
-import sounddevice as sd
-import re
 import time
 
-DetectorFactory.seed = 0
+# Character sets for common scripts, built once at import time
+_CYRILLIC_CHARS = frozenset("абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ")
+_LATIN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+# Seconds since the last ambient-noise calibration after which the microphone is re-sampled
+CALIBRATION_TTL = 300
+
+_langdetect = None
+
+def _load_langdetect():
+    # Only needed when no language is given, so defer the import (and seeding) to first use
+    global _langdetect
+    if _langdetect is None:
+        import langdetect
+        langdetect.DetectorFactory.seed = 0
+        _langdetect = langdetect
+    return _langdetect
 
 class SpeechRecognizer:
+    __slots__ = ("recognizer", "api_key", "proxy", "region", "session", "language", "_calibrated_at")
+    
     def __init__(self, api_key=None, proxy=None, region="westus"):
         self.recognizer = sr.Recognizer()
         self.api_key = api_key
@@ -24,6 +31,7 @@ class SpeechRecognizer:
         self.region = region
         self.session = requests.Session()
         self.language = "ru-RU"  # Default language
+        self._calibrated_at = None
         
         if proxy:
             self.session.proxies.update(proxy)
@@ -57,7 +65,11 @@ class SpeechRecognizer:
             language = self.language
         
         with sr.Microphone() as source:
-            self.recognizer.adjust_for_ambient_noise(source)
+            # Calibrating samples a second of audio, so reuse the energy threshold until CALIBRATION_TTL
+            # has passed since it was last measured (regardless of how recently it was used)
+            if self._calibrated_at is None or time.monotonic() - self._calibrated_at > CALIBRATION_TTL:
+                self.recognizer.adjust_for_ambient_noise(source)
+                self._calibrated_at = time.monotonic()
             print(f"Recording for {duration} seconds...")
             audio = self.recognizer.record(source, duration=duration)
         
@@ -73,21 +85,18 @@ class SpeechRecognizer:
         return self._process_audio(audio, language)
     
     def _process_audio(self, audio, language=None):
-        wav_data = audio.get_wav_data()
-        audio_segment = AudioSegment.from_wav(io.BytesIO(wav_data))
-        
-        if not language:
-            detected_lang = self._detect_language_from_audio(audio_segment)
-            language = "ru-RU" if detected_lang == "ru" else "en-US"
-        
         try:
+            if not language:
+                detected_lang = self._detect_language_from_audio(audio)
+                language = "ru-RU" if detected_lang == "ru" else "en-US"
+            
             if self.api_key:
                 result = self._recognize_with_api(audio, language)
             else:
                 text = self.recognizer.recognize_google(audio, language=language)
                 result = {"text": text, "language": language, "confidence": 0.8}
             
-            result["text"] = self._process_mixed_language_text(result["text"], language)
+            result["text"] = self._normalize_mixed_script_whitespace(result["text"])
             return result
         except sr.UnknownValueError:
             return {"error": "Could not understand audio", "language": language, "confidence": 0.0}
@@ -96,27 +105,21 @@ class SpeechRecognizer:
         except Exception as e:
             return {"error": f"Error: {str(e)}", "language": language, "confidence": 0.0}
     
-    def _detect_language_from_audio(self, audio_segment):
-        sample_duration = min(2000, len(audio_segment))
-        sample = audio_segment[:sample_duration]
+    def _detect_language_from_audio(self, audio):
+        # Slice the first 2 seconds of raw PCM frames directly; no WAV encode/decode needed
+        sample_bytes = 2 * audio.sample_rate * audio.sample_width
+        sample_audio = sr.AudioData(audio.get_raw_data()[:sample_bytes], audio.sample_rate, audio.sample_width)
         
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            sample_path = temp_file.name
-            sample.export(sample_path, format="wav")
+        try:
+            sample_text = self.recognizer.recognize_google(sample_audio)
+        except (sr.UnknownValueError, sr.RequestError, OSError):
+            return "en"
         
+        langdetect = _load_langdetect()
         try:
-            with sr.AudioFile(sample_path) as source:
-                sample_audio = self.recognizer.record(source)
-            
-            try:
-                sample_text = self.recognizer.recognize_google(sample_audio)
-                detected_lang = detect(sample_text)
-                return detected_lang
-            except:
-                return "en"
-        finally:
-            if os.path.exists(sample_path):
-                os.unlink(sample_path)
+            return langdetect.detect(sample_text)
+        except langdetect.LangDetectException:
+            return "en"
     
     def _recognize_with_api(self, audio, language):
         if self.api_key and self.api_key.startswith("microsoft:"):
@@ -181,117 +184,24 @@ class SpeechRecognizer:
         except Exception as e:
             return {"error": f"Microsoft API error: {str(e)}", "language": language, "confidence": 0.0}
     
-    def _process_mixed_language_text(self, text, primary_language):
+    def _normalize_mixed_script_whitespace(self, text):
+        # Collapses runs of whitespace in text that mixes Cyrillic and Latin words; words are kept as-is
         if not text:
             return text
             
-        # Define character sets for common scripts
-        cyrillic = set("абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ")
-        latin = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
-        
         # Check if we have mixed scripts
-        has_cyrillic = any(c in cyrillic for c in text)
-        has_latin = any(c in latin for c in text)
+        has_cyrillic = any(c in _CYRILLIC_CHARS for c in text)
+        has_latin = any(c in _LATIN_CHARS for c in text)
         
         if not (has_cyrillic and has_latin):
             return text
             
-        words = text.split()
-        processed_words = []
-        
-        for word in words:
-            if not word:
-                processed_words.append(word)
-                continue
-                
-            # Count characters from each script
-            cyrillic_count = sum(1 for c in word if c in cyrillic)
-            latin_count = sum(1 for c in word if c in latin)
-            
-            # Determine predominant script in this word
-            is_cyrillic = cyrillic_count > latin_count
-            is_latin = latin_count > cyrillic_count
-            
-            # Process based on primary language
-            if primary_language.startswith(('ru', 'ru-')):
-                # For Russian as primary language
-                if is_latin and not self._is_likely_technical_term(word):
-                    # Consider transliteration for non-technical terms
-                    processed_words.append(word)
-                else:
-                    processed_words.append(word)
-            else:
-                # For English as primary language
-                processed_words.append(word)
-                
-        return ' '.join(processed_words)
-    
-    def _is_likely_technical_term(self, word):
-        if not word or len(word) < 2:
-            return False
-            
-        # Common technical markers/abbreviations
-        tech_markers = [
-            'api', 'sdk', 'http', 'json', 'xml', 'url', 'sql', 'db', 
-            'app', 'dev', 'git', 'npm', 'css', 'html', 'js', 'py',
-            'ui', 'cli', 'id', 'ip', 'yaml', 'toml', 'ssl', 'ssh',
-            'ftp', 'rest', 'oauth', 'jwt', 'spa', 'cdn', 'cors'
-        ]
-        
-        word_lower = word.lower()
-        
-        # Check for technical markers
-        for marker in tech_markers:
-            if marker in word_lower:
-                return True
-                
-        # Check for camelCase or PascalCase (common in programming)
-        has_lower = any(c.islower() for c in word)
-        has_upper = any(c.isupper() for c in word)
-        has_digit = any(c.isdigit() for c in word)
-        
-        # CamelCase check - lowercase followed by uppercase
-        if has_lower and has_upper:
-            for i in range(1, len(word)):
-                if word[i-1].islower() and word[i].isupper():
-                    return True
-                    
-        # Check for words with digits (often technical)
-        if has_digit and (has_lower or has_upper):
-            return True
-            
-        # Check for words with underscores or hyphens (common in programming)
-        if '_' in word or '-' in word:
-            return True
-            
-        return False
-    
-    def _transliterate_latin_to_cyrillic(self, text):
-        # Mapping from Latin to Cyrillic
-        translit_map = {
-            'a': 'а', 'b': 'б', 'v': 'в', 'g': 'г', 'd': 'д', 'e': 'е',
-            'yo': 'ё', 'zh': 'ж', 'z': 'з', 'i': 'и', 'j': 'й', 'k': 'к',
-            'l': 'л', 'm': 'м', 'n': 'н', 'o': 'о', 'p': 'п', 'r': 'р',
-            's': 'с', 't': 'т', 'u': 'у', 'f': 'ф', 'h': 'х', 'ts': 'ц',
-            'ch': 'ч', 'sh': 'ш', 'sch': 'щ', 'y': 'ы', 'e': 'э', 'yu': 'ю',
-            'ya': 'я',
-            # Capital letters
-            'A': 'А', 'B': 'Б', 'V': 'В', 'G': 'Г', 'D': 'Д', 'E': 'Е',
-            'Yo': 'Ё', 'Zh': 'Ж', 'Z': 'З', 'I': 'И', 'J': 'Й', 'K': 'К',
-            'L': 'Л', 'M': 'М', 'N': 'Н', 'O': 'О', 'P': 'П', 'R': 'Р',
-            'S': 'С', 'T': 'Т', 'U': 'У', 'F': 'Ф', 'H': 'Х', 'Ts': 'Ц',
-            'Ch': 'Ч', 'Sh': 'Ш', 'Sch': 'Щ', 'Y': 'Ы', 'E': 'Э', 'Yu': 'Ю',
-            'Ya': 'Я'
-        }
-        
-        # Simple implementation - would need more sophisticated logic for real use
-        result = text
-        for lat, cyr in sorted(translit_map.items(), key=lambda x: len(x[0]), reverse=True):
-            result = result.replace(lat, cyr)
-            
-        return result
+        return ' '.join(text.split())
     
     def record_audio(self, duration=5, sample_rate=16000):
+        # Imported on first use; only this helper needs PortAudio
+        import sounddevice as sd
+        
         print(f"Recording {duration} seconds of audio...")
         audio_data = sd.rec(int(duration * sample_rate), 
                            samplerate=sample_rate, channels=1, dtype='int16')
@@ -29,6 +29,19 @@ namespace VoiceDictation.Core.SpeechRecognition
         private CancellationTokenSource? _continuousRecognitionCts;
         private bool _isDisposed;
         
+        private static readonly HashSet<char> CyrillicChars = new HashSet<char>("абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ");
+        private static readonly HashSet<char> LatinChars = new HashSet<char>("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ");
+        
+        private static readonly IReadOnlyList<LanguageInfo> AvailableLanguages = new[]
+        {
+            new LanguageInfo("ru-RU", "Russian"),
+            new LanguageInfo("en-US", "English (US)"),
+            new LanguageInfo("en-GB", "English (UK)"),
+            new LanguageInfo("fr-FR", "French"),
+            new LanguageInfo("de-DE", "German"),
+            new LanguageInfo("es-ES", "Spanish")
+        };
+        
         /// <inheritdoc/>
         public event EventHandler<SpeechRecognizedEventArgs>? SpeechRecognized;
         
@@ -102,15 +115,7 @@ namespace VoiceDictation.Core.SpeechRecognition
         /// <inheritdoc/>
         public IEnumerable<LanguageInfo> GetAvailableLanguages()
         {
-            return new List<LanguageInfo>
-            {
-                new LanguageInfo("ru-RU", "Russian"),
-                new LanguageInfo("en-US", "English (US)"),
-                new LanguageInfo("en-GB", "English (UK)"),
-                new LanguageInfo("fr-FR", "French"),
-                new LanguageInfo("de-DE", "German"),
-                new LanguageInfo("es-ES", "Spanish")
-            };
+            return AvailableLanguages;
         }
         
         /// <inheritdoc/>
@@ -490,7 +495,7 @@ namespace VoiceDictation.Core.SpeechRecognition
                             }
                         }
                         
-                        string processedText = ProcessMixedLanguageText(result.Text, detectedLanguage);
+                        string processedText = NormalizeMixedScriptWhitespace(result.Text);
                         
                         return new SpeechRecognitionResult(processedText, confidence, detectedLanguage);
                     }
@@ -566,137 +571,25 @@ namespace VoiceDictation.Core.SpeechRecognition
         }
         
         /// <summary>
-        /// Processes text with mixed language content
+        /// Collapses runs of whitespace in text that mixes Cyrillic and Latin words; words are kept as-is
         /// </summary>
-        private string ProcessMixedLanguageText(string text, string primaryLanguage)
+        private static string NormalizeMixedScriptWhitespace(string text)
         {
             if (string.IsNullOrWhiteSpace(text))
             {
                 return text;
             }
             
-            try
-            {
-                var cyrillic = new HashSet<char>("абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ");
-                var latin = new HashSet<char>("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ");
-                
-                bool hasCyrillic = text.Any(c => cyrillic.Contains(c));
-                bool hasLatin = text.Any(c => latin.Contains(c));
-                
-                if (!(hasCyrillic && hasLatin))
-                {
-                    return text;
-                }
-                
-                var words = text.Split(new[] { ' ', '\t', '\n', '\r' }, StringSplitOptions.RemoveEmptyEntries);
-                var processedWords = new List<string>();
-                
-                foreach (var word in words)
-                {
-                    if (string.IsNullOrWhiteSpace(word))
-                    {
-                        processedWords.Add(word);
-                        continue;
-                    }
-                    
-                    int cyrillicCount = word.Count(c => cyrillic.Contains(c));
-                    int latinCount = word.Count(c => latin.Contains(c));
-                    
-                    string wordScript = cyrillicCount > latinCount ? "cyrillic" : 
-                                        latinCount > cyrillicCount ? "latin" : 
-                                        "mixed";
-                    
-                    if (primaryLanguage.StartsWith("ru", StringComparison.OrdinalIgnoreCase))
-                    {
-                        if (wordScript == "latin")
-                        {
-                            if (IsLikelyTechnicalTerm(word))
-                            {
-                                processedWords.Add(word);
-                            }
-                            else if (word.Length > 0 && char.IsUpper(word[0]))
-                            {
-                                processedWords.Add(word);
-                            }
-                            else
-                            {
-                                processedWords.Add(word);
-                            }
-                        }
-                        else
-                        {
-                            processedWords.Add(word);
-                        }
-                    }
-                    else
-                    {
-                        if (wordScript == "cyrillic")
-                        {
-                            processedWords.Add(word);
-                        }
-                        else
-                        {
-                            processedWords.Add(word);
-                        }
-                    }
-                }
-                
-                return string.Join(" ", processedWords);
-            }
-            catch (Exception ex)
-            {
-                _logger.LogError(ex, "Error processing mixed language text");
-                return text;
-            }
-        }
-        
-        /// <summary>
-        /// Determines if a word is likely a technical term
-        /// </summary>
-        private bool IsLikelyTechnicalTerm(string word)
-        {
-            if (string.IsNullOrWhiteSpace(word) || word.Length < 2)
-            {
-                return false;
-            }
-            
-            var technicalMarkers = new[] { 
-                "api", "sdk", "http", "json", "xml", "url", "sql", "db", 
-                "app", "dev", "git", "npm", "css", "html", "js", "py"
-            };
-            
-            string loweredWord = word.ToLowerInvariant();
-            
-            foreach (var marker in technicalMarkers)
-            {
-                if (loweredWord.Contains(marker))
-                {
-                    return true;
-                }
-            }
-            
-            bool hasLower = word.Any(char.IsLower);
-            bool hasUpper = word.Any(char.IsUpper);
+            bool hasCyrillic = text.Any(c => CyrillicChars.Contains(c));
+            bool hasLatin = text.Any(c => LatinChars.Contains(c));
             
-            if (hasLower && hasUpper && !word.All(c => char.IsLetterOrDigit(c) || c == '_'))
+            if (!(hasCyrillic && hasLatin))
             {
-                bool hasMixedCase = false;
-                for (int i = 1; i < word.Length; i++)
-                {
-                    if (char.IsLower(word[i-1]) && char.IsUpper(word[i]))
-                    {
-                        hasMixedCase = true;
-                        break;
-                    }
-                }
-                
-                if (hasMixedCase)
-                {
-                    return true;
-                }
+                return text;
             }
             
-            return false;
+            var words = text.Split(new[] { ' ', '\t', '\n', '\r' }, StringSplitOptions.RemoveEmptyEntries);
+            return string.Join(" ", words);
         }
         
         private void OnSpeechRecognized(SpeechRecognizedEventArgs e)
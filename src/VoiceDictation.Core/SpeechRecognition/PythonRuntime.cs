@@ -13,11 +13,14 @@ namespace VoiceDictation.Core.SpeechRecognition
     {
         private readonly ILogger _logger;
         private readonly string _pythonModulesPath;
-        private bool _pythonInitialized;
+        private volatile bool _pythonInitialized;
         private bool _isDisposed;
         private string? _pythonHome;
         private readonly object _pythonLock = new object();
         
+        // Installation probing only needs to hit the file system once per process
+        private static readonly Lazy<string?> DiscoveredPythonHome = new Lazy<string?>(DiscoverPythonHome);
+        
         /// <summary>
         /// Initializes a new instance of the <see cref="PythonRuntime"/> class
         /// </summary>
@@ -28,44 +31,43 @@ namespace VoiceDictation.Core.SpeechRecognition
             _logger = logger;
             _pythonModulesPath = pythonModulesPath;
             
-            _pythonHome = Environment.GetEnvironmentVariable("PYTHONHOME");
-            if (string.IsNullOrEmpty(_pythonHome))
+            // Locating and starting the Python engine is deferred to the first Initialize/EnsureInitialized call.
+            // That call blocks for as long as the engine takes to start, so callers make it from a background
+            // thread (PythonSpeechRecognizer does so via EnsureInitializedAsync), never from the UI thread
+        }
+        
+        /// <summary>
+        /// Probes well-known install locations for a Python installation
+        /// </summary>
+        private static string? DiscoverPythonHome()
+        {
+            var roots = new[]
             {
-                var possiblePaths = new[]
+                Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles),
+                Environment.GetFolderPath(Environment.SpecialFolder.ProgramFilesX86),
+                @"C:\"
+            };
+            var versions = new[] { "Python39", "Python310", "Python311", "Python312" };
+            
+            // A single File.Exists per candidate: it already fails when the directory is missing
+            foreach (var root in roots)
+            {
+                if (string.IsNullOrEmpty(root))
                 {
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles), "Python39"),
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles), "Python310"),
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles), "Python311"),
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFiles), "Python312"),
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFilesX86), "Python39"),
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFilesX86), "Python310"),
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFilesX86), "Python311"),
-                    Path.Combine(Environment.GetFolderPath(Environment.SpecialFolder.ProgramFilesX86), "Python312"),
-                    @"C:\Python39",
-                    @"C:\Python310",
-                    @"C:\Python311",
-                    @"C:\Python312"
-                };
+                    continue;
+                }
                 
-                foreach (var path in possiblePaths)
+                foreach (var version in versions)
                 {
-                    if (Directory.Exists(path) && File.Exists(Path.Combine(path, "python.exe")))
+                    var path = Path.Combine(root, version);
+                    if (File.Exists(Path.Combine(path, "python.exe")))
                     {
-                        _pythonHome = path;
-                        _logger.LogInformation("Found Python installation at {PythonHome}", _pythonHome);
-                        break;
+                        return path;
                     }
                 }
             }
             
-            try
-            {
-                Initialize();
-            }
-            catch (Exception ex)
-            {
-                _logger.LogWarning(ex, "Failed to initialize Python runtime. Will attempt to initialize on first use.");
-            }
+            return null;
         }
         
         /// <summary>
@@ -74,7 +76,8 @@ namespace VoiceDictation.Core.SpeechRecognition
         public bool IsInitialized => _pythonInitialized;
         
         /// <summary>
-        /// Initializes Python runtime and loads necessary modules
+        /// Initializes Python runtime and loads necessary modules. Blocks until the engine has started;
+        /// call it from a background thread.
         /// </summary>
         public void Initialize()
         {
@@ -92,6 +95,19 @@ namespace VoiceDictation.Core.SpeechRecognition
                 
                 try
                 {
+                    if (string.IsNullOrEmpty(_pythonHome))
+                    {
+                        _pythonHome = Environment.GetEnvironmentVariable("PYTHONHOME");
+                        if (string.IsNullOrEmpty(_pythonHome))
+                        {
+                            _pythonHome = DiscoveredPythonHome.Value;
+                            if (_pythonHome != null)
+                            {
+                                _logger.LogInformation("Found Python installation at {PythonHome}", _pythonHome);
+                            }
+                        }
+                    }
+                    
                     if (!string.IsNullOrEmpty(_pythonHome))
                     {
                         Runtime.PythonDLL = Path.Combine(_pythonHome, "python3.dll");
@@ -185,8 +201,15 @@ namespace VoiceDictation.Core.SpeechRecognition
         {
             EnsureInitialized();
             
+            // The GIL does not guard against engine teardown, so an import must hold _pythonLock like any
+            // other call that must not overlap Shutdown()
             lock (_pythonLock)
             {
+                if (!_pythonInitialized)
+                {
+                    throw new InvalidOperationException("Python runtime has been shut down");
+                }
+                
                 try
                 {
                     using (Py.GIL())
@@ -24,8 +24,17 @@ namespace VoiceDictation.Core.SpeechRecognition
         private CancellationTokenSource? _continuousRecognitionCts;
         private bool _isDisposed;
         private dynamic? _pythonRecognizer;
+        private readonly SemaphoreSlim _initializationLock = new SemaphoreSlim(1, 1);
         
-        private readonly Dictionary<string, LanguageInfo> _availableLanguages;
+        private static readonly Dictionary<string, LanguageInfo> AvailableLanguages = new Dictionary<string, LanguageInfo>
+        {
+            { "ru-RU", new LanguageInfo("ru-RU", "Russian") },
+            { "en-US", new LanguageInfo("en-US", "English (US)") },
+            { "en-GB", new LanguageInfo("en-GB", "English (UK)") },
+            { "fr-FR", new LanguageInfo("fr-FR", "French") },
+            { "de-DE", new LanguageInfo("de-DE", "German") },
+            { "es-ES", new LanguageInfo("es-ES", "Spanish") }
+        };
         
         /// <inheritdoc/>
         public event EventHandler<SpeechRecognizedEventArgs>? SpeechRecognized;
@@ -69,24 +78,8 @@ namespace VoiceDictation.Core.SpeechRecognition
             _resultParser = new RecognitionResultParser(logger);
             _proxyManager = new ProxyConfigManager(logger);
             
-            _availableLanguages = new Dictionary<string, LanguageInfo>
-            {
-                { "ru-RU", new LanguageInfo("ru-RU", "Russian") },
-                { "en-US", new LanguageInfo("en-US", "English (US)") },
-                { "en-GB", new LanguageInfo("en-GB", "English (UK)") },
-                { "fr-FR", new LanguageInfo("fr-FR", "French") },
-                { "de-DE", new LanguageInfo("de-DE", "German") },
-                { "es-ES", new LanguageInfo("es-ES", "Spanish") }
-            };
-            
-            try
-            {
-                InitializeRecognizer();
-            }
-            catch (Exception ex)
-            {
-                _logger.LogWarning(ex, "Failed to initialize speech recognizer. Will attempt to initialize on first use.");
-            }
+            // The Python recognizer is created on first use (see EnsureInitializedAsync) so that
+            // constructing this service does not import speech_recognition and its dependencies
         }
         
         /// <inheritdoc/>
@@ -114,16 +107,16 @@ namespace VoiceDictation.Core.SpeechRecognition
         /// <inheritdoc/>
         public IEnumerable<LanguageInfo> GetAvailableLanguages()
         {
-            return _availableLanguages.Values;
+            return AvailableLanguages.Values;
         }
         
         /// <inheritdoc/>
         public async Task<SpeechRecognitionResult> RecognizeFromFileAsync(string filePath, CancellationToken cancellationToken = default)
         {
-            EnsureInitialized();
-            
             try
             {
+                await EnsureInitializedAsync(cancellationToken);
+                
                 if (!File.Exists(filePath))
                 {
                     throw new FileNotFoundException("Audio file not found", filePath);
@@ -162,10 +155,10 @@ namespace VoiceDictation.Core.SpeechRecognition
         /// <inheritdoc/>
         public async Task<SpeechRecognitionResult> RecognizeOnceAsync(int maxDurationInSeconds = 30, CancellationToken cancellationToken = default)
         {
-            EnsureInitialized();
-            
             try
             {
+                await EnsureInitializedAsync(cancellationToken);
+                
                 if (maxDurationInSeconds < 1 || maxDurationInSeconds > 60)
                 {
                     maxDurationInSeconds = 5;
@@ -212,10 +205,26 @@ namespace VoiceDictation.Core.SpeechRecognition
                 return;
             }
             
-            _isListening = true;
             OnStatusChanged(SpeechRecognitionStatus.Initializing, "Starting continuous recognition");
             
-            EnsureInitialized();
+            try
+            {
+                await EnsureInitializedAsync(cancellationToken);
+            }
+            catch (Exception ex)
+            {
+                OnSpeechError(new SpeechErrorEventArgs($"Error starting continuous recognition: {ex.Message}"));
+                OnStatusChanged(SpeechRecognitionStatus.Error, ex.Message);
+                throw;
+            }
+            
+            // Another start may have completed while this one was waiting for initialization
+            if (_isListening)
+            {
+                return;
+            }
+            
+            _isListening = true;
             
             _continuousRecognitionCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
             
@@ -290,11 +299,21 @@ namespace VoiceDictation.Core.SpeechRecognition
                 StopContinuousRecognitionAsync().Wait();
             }
             
-            _continuousRecognitionCts?.Dispose();
-            _pythonRecognizer = null;
-            _pythonRuntime.Dispose();
-            
-            _isDisposed = true;
+            // Wait for an in-flight initialization so the runtime is not shut down in the middle of an import.
+            // The lock itself is not disposed: callers still queued on it must wake up and observe _isDisposed.
+            _initializationLock.Wait();
+            try
+            {
+                _isDisposed = true;
+                
+                _continuousRecognitionCts?.Dispose();
+                _pythonRecognizer = null;
+                _pythonRuntime.Dispose();
+            }
+            finally
+            {
+                _initializationLock.Release();
+            }
         }
         
         /// <summary>
@@ -307,8 +326,15 @@ namespace VoiceDictation.Core.SpeechRecognition
                 _pythonRuntime.EnsureInitialized();
                 
                 var speechRecognitionModule = _pythonRuntime.ImportModule("speech_recognition");
-                _pythonRecognizer = speechRecognitionModule.SpeechRecognizer();
-                _pythonRecognizer.set_language(_language);
+                var recognizer = speechRecognitionModule.SpeechRecognizer();
+                recognizer.set_language(_language);
+                
+                if (_isDisposed)
+                {
+                    return;
+                }
+                
+                _pythonRecognizer = recognizer;
                 
                 if (_apiKey != null || _proxySettings != null)
                 {
@@ -323,13 +349,32 @@ namespace VoiceDictation.Core.SpeechRecognition
         }
         
         /// <summary>
-        /// Ensures that the recognizer is initialized
+        /// Ensures that the recognizer is initialized. Starting the Python engine and importing the
+        /// recognition module can take seconds, so it runs on the thread pool rather than the caller's thread.
         /// </summary>
-        private void EnsureInitialized()
+        private async Task EnsureInitializedAsync(CancellationToken cancellationToken)
         {
-            if (_pythonRecognizer == null)
+            if (_pythonRecognizer != null)
+            {
+                return;
+            }
+            
+            ObjectDisposedException.ThrowIf(_isDisposed, this);
+            
+            // ConfigureAwait(false): Dispose may block the UI thread on this lock while the release is pending
+            await _initializationLock.WaitAsync(cancellationToken).ConfigureAwait(false);
+            try
+            {
+                ObjectDisposedException.ThrowIf(_isDisposed, this);
+                
+                if (_pythonRecognizer == null)
+                {
+                    await Task.Run(InitializeRecognizer, cancellationToken).ConfigureAwait(false);
+                }
+            }
+            finally
             {
-                InitializeRecognizer();
+                _initializationLock.Release();
             }
         }
         
@@ -353,7 +398,7 @@ namespace VoiceDictation.Core.SpeechRecognition
                 
                 // Return simulated results for testing purposes
                 return _resultParser.CreateSimulatedResult(functionName, 
-                    parameters.ContainsKey("language") ? parameters["language"].ToString() : _language);
+                    parameters.TryGetValue("language", out var language) ? language.ToString() : _language);
             }
         }
         
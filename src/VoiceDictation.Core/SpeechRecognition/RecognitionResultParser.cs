@@ -13,6 +13,16 @@ namespace VoiceDictation.Core.SpeechRecognition
     {
         private readonly ILogger _logger;
         
+        private const string DefaultSimulatedText = "This is a test text for speech recognition.";
+        
+        private static readonly (string Prefix, string Text)[] SimulatedTexts =
+        {
+            ("ru", "Это тестовый текст для распознавания речи."),
+            ("fr", "C'est un texte de test pour la reconnaissance vocale."),
+            ("de", "Dies ist ein Testtext für die Spracherkennung."),
+            ("es", "Este es un texto de prueba para el reconocimiento de voz.")
+        };
+        
         /// <summary>
         /// Initializes a new instance of the <see cref="RecognitionResultParser"/> class
         /// </summary>
@@ -35,20 +45,20 @@ namespace VoiceDictation.Core.SpeechRecognition
                 
                 if (parsedResult != null)
                 {
-                    if (parsedResult.ContainsKey("error"))
+                    string language = parsedResult.TryGetValue("language", out var languageValue) ? 
+                        languageValue.ToString() ?? "" : "";
+                    
+                    if (parsedResult.TryGetValue("error", out var errorValue))
                     {
-                        string errorMessage = parsedResult["error"].ToString() ?? "Unknown error";
-                        string language = parsedResult.ContainsKey("language") ? parsedResult["language"].ToString() ?? "" : "";
+                        string errorMessage = errorValue.ToString() ?? "Unknown error";
                         
                         return new SpeechRecognitionResult(errorMessage, language);
                     }
-                    else if (parsedResult.ContainsKey("text"))
+                    else if (parsedResult.TryGetValue("text", out var textValue))
                     {
-                        string text = parsedResult["text"].ToString() ?? "";
-                        float confidence = parsedResult.ContainsKey("confidence") ? 
-                            Convert.ToSingle(parsedResult["confidence"]) : 0.0f;
-                        string language = parsedResult.ContainsKey("language") ? 
-                            parsedResult["language"].ToString() ?? "" : "";
+                        string text = textValue.ToString() ?? "";
+                        float confidence = parsedResult.TryGetValue("confidence", out var confidenceValue) ? 
+                            Convert.ToSingle(confidenceValue) : 0.0f;
                         
                         text = TextProcessingUtils.ProcessMixedLanguageText(text, language);
                         text = TextProcessingUtils.FormatRecognizedText(text);
@@ -74,26 +84,14 @@ namespace VoiceDictation.Core.SpeechRecognition
         /// <returns>A JSON string representing a simulated result</returns>
         public string CreateSimulatedResult(string functionName, string language)
         {
-            string recognizedText;
-            if (language.StartsWith("ru", StringComparison.OrdinalIgnoreCase))
-            {
-                recognizedText = "Это тестовый текст для распознавания речи.";
-            }
-            else if (language.StartsWith("fr", StringComparison.OrdinalIgnoreCase))
-            {
-                recognizedText = "C'est un texte de test pour la reconnaissance vocale.";
-            }
-            else if (language.StartsWith("de", StringComparison.OrdinalIgnoreCase))
-            {
-                recognizedText = "Dies ist ein Testtext für die Spracherkennung.";
-            }
-            else if (language.StartsWith("es", StringComparison.OrdinalIgnoreCase))
-            {
-                recognizedText = "Este es un texto de prueba para el reconocimiento de voz.";
-            }
-            else
+            string recognizedText = DefaultSimulatedText;
+            foreach (var (prefix, text) in SimulatedTexts)
             {
-                recognizedText = "This is a test text for speech recognition.";
+                if (language.StartsWith(prefix, StringComparison.OrdinalIgnoreCase))
+                {
+                    recognizedText = text;
+                    break;
+                }
             }
             
             if (functionName == "recognize_from_microphone" || functionName == "recognize_from_file")
@@ -107,11 +105,7 @@ namespace VoiceDictation.Core.SpeechRecognition
                 
                 return JsonConvert.SerializeObject(simulatedResult);
             }
-            else if (functionName == "set_language")
-            {
-                return JsonConvert.SerializeObject(new { success = true });
-            }
-            else if (functionName == "update_config")
+            else if (functionName == "set_language" || functionName == "update_config")
             {
                 return JsonConvert.SerializeObject(new { success = true });
             }
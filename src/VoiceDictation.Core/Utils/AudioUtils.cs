@@ -1,5 +1,7 @@
 using System;
 using System.IO;
+using System.Numerics;
+using System.Runtime.InteropServices;
 using System.Threading.Tasks;
 using NAudio.Wave;
 using NAudio.Wave.SampleProviders;
@@ -19,39 +21,32 @@ namespace VoiceDictation.Core.Utils
                 if (!File.Exists(sourceFile))
                     return false;
 
-                float peakAmplitude = 0;
                 using (var reader = new AudioFileReader(sourceFile))
                 {
+                    float peakAmplitude = 0;
                     var buffer = new float[reader.WaveFormat.SampleRate * reader.WaveFormat.Channels];
                     int read;
                     while ((read = reader.Read(buffer, 0, buffer.Length)) > 0)
                     {
-                        for (int i = 0; i < read; i++)
-                        {
-                            var abs = Math.Abs(buffer[i]);
-                            if (abs > peakAmplitude)
-                                peakAmplitude = abs;
-                        }
+                        peakAmplitude = Math.Max(peakAmplitude, FindPeakAmplitude(buffer.AsSpan(0, read)));
                     }
-                }
 
-                if (Math.Abs(peakAmplitude - targetPeakAmplitude) < 0.05)
-                {
-                    if (sourceFile != targetFile)
-                        File.Copy(sourceFile, targetFile, true);
-                    return true;
-                }
+                    if (Math.Abs(peakAmplitude - targetPeakAmplitude) >= 0.05)
+                    {
+                        // Rewind the open reader for the gain pass; this still decodes the samples again but avoids reopening the file and re-parsing its header
+                        reader.Position = 0;
 
-                float gainFactor = targetPeakAmplitude / peakAmplitude;
-                
-                using (var reader = new AudioFileReader(sourceFile))
-                {
-                    var volumeSampleProvider = new VolumeSampleProvider(reader);
-                    volumeSampleProvider.Volume = gainFactor;
-                    
-                    WaveFileWriter.CreateWaveFile16(targetFile, volumeSampleProvider);
+                        var volumeSampleProvider = new VolumeSampleProvider(reader);
+                        volumeSampleProvider.Volume = targetPeakAmplitude / peakAmplitude;
+
+                        WaveFileWriter.CreateWaveFile16(targetFile, volumeSampleProvider);
+                        return File.Exists(targetFile);
+                    }
                 }
 
+                if (sourceFile != targetFile)
+                    File.Copy(sourceFile, targetFile, true);
+
                 return File.Exists(targetFile);
             }
             catch (Exception)
@@ -69,8 +64,7 @@ namespace VoiceDictation.Core.Utils
 
                 using (var reader = new AudioFileReader(sourceFile))
                 {
-                    int startPos = FindNonSilenceStart(reader, silenceThreshold);
-                    int endPos = FindNonSilenceEnd(reader, silenceThreshold);
+                    var (startPos, endPos) = FindNonSilenceBounds(reader, silenceThreshold);
                     
                     if (startPos >= endPos)
                     {
@@ -102,51 +96,145 @@ namespace VoiceDictation.Core.Utils
             }
         }
 
-        private static int FindNonSilenceStart(AudioFileReader reader, float threshold)
+        private static float FindPeakAmplitude(ReadOnlySpan<float> samples)
         {
-            reader.Position = 0;
-            var buffer = new float[1024];
-            int read;
-            int position = 0;
-            
-            while ((read = reader.Read(buffer, 0, buffer.Length)) > 0)
+            float peak = 0;
+            int i = 0;
+
+            if (Vector.IsHardwareAccelerated && samples.Length >= Vector<float>.Count)
             {
-                for (int i = 0; i < read; i++)
+                var peaks = Vector<float>.Zero;
+                var vectors = MemoryMarshal.Cast<float, Vector<float>>(samples);
+
+                foreach (var vector in vectors)
                 {
-                    if (Math.Abs(buffer[i]) > threshold)
+                    peaks = Vector.Max(peaks, Vector.Abs(vector));
+                }
+
+                for (int lane = 0; lane < Vector<float>.Count; lane++)
+                {
+                    if (peaks[lane] > peak)
+                        peak = peaks[lane];
+                }
+
+                i = vectors.Length * Vector<float>.Count;
+            }
+
+            for (; i < samples.Length; i++)
+            {
+                var abs = Math.Abs(samples[i]);
+                if (abs > peak)
+                    peak = abs;
+            }
+
+            return peak;
+        }
+
+        private static int IndexOfAboveThreshold(ReadOnlySpan<float> samples, float threshold)
+        {
+            int i = 0;
+
+            if (Vector.IsHardwareAccelerated && samples.Length >= Vector<float>.Count)
+            {
+                var limit = new Vector<float>(threshold);
+                var vectors = MemoryMarshal.Cast<float, Vector<float>>(samples);
+
+                for (int v = 0; v < vectors.Length; v++)
+                {
+                    if (Vector.GreaterThanAny(Vector.Abs(vectors[v]), limit))
                     {
-                        return position + i;
+                        i = v * Vector<float>.Count;
+                        break;
                     }
+
+                    i = (v + 1) * Vector<float>.Count;
                 }
-                
-                position += read;
             }
-            
-            return 0; // No non-silent audio found
+
+            for (; i < samples.Length; i++)
+            {
+                if (Math.Abs(samples[i]) > threshold)
+                    return i;
+            }
+
+            return -1;
+        }
+
+        private static int LastIndexOfAboveThreshold(ReadOnlySpan<float> samples, float threshold)
+        {
+            int i = samples.Length - 1;
+
+            if (Vector.IsHardwareAccelerated && samples.Length >= Vector<float>.Count)
+            {
+                var limit = new Vector<float>(threshold);
+                var vectors = MemoryMarshal.Cast<float, Vector<float>>(samples);
+                int vectorized = vectors.Length * Vector<float>.Count;
+
+                for (; i >= vectorized; i--)
+                {
+                    if (Math.Abs(samples[i]) > threshold)
+                        return i;
+                }
+
+                for (int v = vectors.Length - 1; v >= 0; v--)
+                {
+                    if (Vector.GreaterThanAny(Vector.Abs(vectors[v]), limit))
+                    {
+                        i = (v + 1) * Vector<float>.Count - 1;
+                        break;
+                    }
+
+                    i = v * Vector<float>.Count - 1;
+                }
+            }
+
+            for (; i >= 0; i--)
+            {
+                if (Math.Abs(samples[i]) > threshold)
+                    return i;
+            }
+
+            return -1;
         }
 
-        private static int FindNonSilenceEnd(AudioFileReader reader, float threshold)
+        private static (int Start, int End) FindNonSilenceBounds(AudioFileReader reader, float threshold)
         {
             reader.Position = 0;
             var buffer = new float[1024];
             int read;
             int position = 0;
+            int firstNonSilencePos = -1;
             int lastNonSilencePos = 0;
             
+            // Locate both edges in one pass over the file rather than decoding it twice
             while ((read = reader.Read(buffer, 0, buffer.Length)) > 0)
             {
-                for (int i = 0; i < read; i++)
+                var samples = buffer.AsSpan(0, read);
+                
+                if (firstNonSilencePos < 0)
+                {
+                    int first = IndexOfAboveThreshold(samples, threshold);
+                    if (first >= 0)
+                    {
+                        firstNonSilencePos = position + first;
+                    }
+                }
+                
+                if (firstNonSilencePos >= 0)
                 {
-                    if (Math.Abs(buffer[i]) > threshold)
+                    int last = LastIndexOfAboveThreshold(samples, threshold);
+                    if (last >= 0)
                     {
-                        lastNonSilencePos = position + i;
+                        lastNonSilencePos = position + last;
                     }
                 }
                 
                 position += read;
             }
             
-            return lastNonSilencePos > 0 ? lastNonSilencePos + 1 : position; // Add 1 to include the last non-silent sample
+            int start = firstNonSilencePos >= 0 ? firstNonSilencePos : 0; // No non-silent audio found
+            int end = lastNonSilencePos > 0 ? lastNonSilencePos + 1 : position; // Add 1 to include the last non-silent sample
+            return (start, end);
         }
 
         public static bool ConvertAudioFormat(string sourceFile, string targetFile)
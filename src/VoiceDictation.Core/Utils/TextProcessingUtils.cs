@@ -9,17 +9,37 @@ namespace VoiceDictation.Core.Utils
     /// <summary>
     /// Utility class for text processing operations
     /// </summary>
-    public static class TextProcessingUtils
+    public static partial class TextProcessingUtils
     {
+        private static readonly string[] TechMarkers =
+        {
+            "api", "sdk", "http", "json", "xml", "url", "sql", "db",
+            "app", "dev", "git", "npm", "css", "html", "js", "py",
+            "ui", "cli", "id", "ip", "yaml", "toml", "ssl", "ssh",
+            "ftp", "rest", "oauth", "jwt", "spa", "cdn", "cors"
+        };
+
+        [GeneratedRegex(@"(^|[.!?]\s+)([a-zа-яё])")]
+        private static partial Regex SentenceStartRegex();
+
         public static bool ContainsMixedScript(string text)
         {
             if (string.IsNullOrEmpty(text))
                 return false;
 
-            bool hasCyrillic = text.Any(c => c >= '\u0400' && c <= '\u04FF');
-            bool hasLatin = text.Any(c => (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z'));
+            bool hasCyrillic = false;
+            bool hasLatin = false;
 
-            return hasCyrillic && hasLatin;
+            foreach (char c in text)
+            {
+                hasCyrillic |= IsCyrillic(c);
+                hasLatin |= IsLatin(c);
+
+                if (hasCyrillic && hasLatin)
+                    return true;
+            }
+
+            return false;
         }
 
         public static bool IsLikelyTechnicalTerm(string word)
@@ -27,17 +47,11 @@ namespace VoiceDictation.Core.Utils
             if (string.IsNullOrEmpty(word) || word.Length < 2)
                 return false;
 
-            string[] techMarkers = {
-                "api", "sdk", "http", "json", "xml", "url", "sql", "db",
-                "app", "dev", "git", "npm", "css", "html", "js", "py",
-                "ui", "cli", "id", "ip", "yaml", "toml", "ssl", "ssh",
-                "ftp", "rest", "oauth", "jwt", "spa", "cdn", "cors"
-            };
-
-            string wordLower = word.ToLowerInvariant();
-
-            if (techMarkers.Any(marker => wordLower.Contains(marker)))
-                return true;
+            foreach (var marker in TechMarkers)
+            {
+                if (word.Contains(marker, StringComparison.OrdinalIgnoreCase))
+                    return true;
+            }
 
             bool hasLower = word.Any(char.IsLower);
             bool hasUpper = word.Any(char.IsUpper);
@@ -61,29 +75,30 @@ namespace VoiceDictation.Core.Utils
             return false;
         }
 
+        // Longest keys first so multi-letter combinations are replaced before single letters
+        private static readonly KeyValuePair<string, string>[] TranslitPairs = new Dictionary<string, string>
+        {
+            {"a", "а"}, {"b", "б"}, {"v", "в"}, {"g", "г"}, {"d", "д"}, {"e", "е"},
+            {"yo", "ё"}, {"zh", "ж"}, {"z", "з"}, {"i", "и"}, {"j", "й"}, {"k", "к"},
+            {"l", "л"}, {"m", "м"}, {"n", "н"}, {"o", "о"}, {"p", "п"}, {"r", "р"},
+            {"s", "с"}, {"t", "т"}, {"u", "у"}, {"f", "ф"}, {"h", "х"}, {"ts", "ц"},
+            {"ch", "ч"}, {"sh", "ш"}, {"sch", "щ"}, {"y", "ы"}, {"yu", "ю"},
+            {"ya", "я"},
+            // Capital letters
+            {"A", "А"}, {"B", "Б"}, {"V", "В"}, {"G", "Г"}, {"D", "Д"}, {"E", "Е"},
+            {"Yo", "Ё"}, {"Zh", "Ж"}, {"Z", "З"}, {"I", "И"}, {"J", "Й"}, {"K", "К"},
+            {"L", "Л"}, {"M", "М"}, {"N", "Н"}, {"O", "О"}, {"P", "П"}, {"R", "Р"},
+            {"S", "С"}, {"T", "Т"}, {"U", "У"}, {"F", "Ф"}, {"H", "Х"}, {"Ts", "Ц"},
+            {"Ch", "Ч"}, {"Sh", "Ш"}, {"Sch", "Щ"}, {"Y", "Ы"}, {"Yu", "Ю"},
+            {"Ya", "Я"}
+        }.OrderByDescending(p => p.Key.Length).ToArray();
+
         public static string TransliterateLatinToCyrillic(string text)
         {
             if (string.IsNullOrEmpty(text))
                 return text;
 
-            var translitMap = new Dictionary<string, string>
-            {
-                {"a", "а"}, {"b", "б"}, {"v", "в"}, {"g", "г"}, {"d", "д"}, {"e", "е"},
-                {"yo", "ё"}, {"zh", "ж"}, {"z", "з"}, {"i", "и"}, {"j", "й"}, {"k", "к"},
-                {"l", "л"}, {"m", "м"}, {"n", "н"}, {"o", "о"}, {"p", "п"}, {"r", "р"},
-                {"s", "с"}, {"t", "т"}, {"u", "у"}, {"f", "ф"}, {"h", "х"}, {"ts", "ц"},
-                {"ch", "ч"}, {"sh", "ш"}, {"sch", "щ"}, {"y", "ы"}, {"e", "э"}, {"yu", "ю"},
-                {"ya", "я"},
-                // Capital letters
-                {"A", "А"}, {"B", "Б"}, {"V", "В"}, {"G", "Г"}, {"D", "Д"}, {"E", "Е"},
-                {"Yo", "Ё"}, {"Zh", "Ж"}, {"Z", "З"}, {"I", "И"}, {"J", "Й"}, {"K", "К"},
-                {"L", "Л"}, {"M", "М"}, {"N", "Н"}, {"O", "О"}, {"P", "П"}, {"R", "Р"},
-                {"S", "С"}, {"T", "Т"}, {"U", "У"}, {"F", "Ф"}, {"H", "Х"}, {"Ts", "Ц"},
-                {"Ch", "Ч"}, {"Sh", "Ш"}, {"Sch", "Щ"}, {"Y", "Ы"}, {"E", "Э"}, {"Yu", "Ю"},
-                {"Ya", "Я"}
-            };
-
-            foreach (var pair in translitMap.OrderByDescending(p => p.Key.Length))
+            foreach (var pair in TranslitPairs)
             {
                 text = text.Replace(pair.Key, pair.Value);
             }
@@ -97,47 +112,32 @@ namespace VoiceDictation.Core.Utils
                 return text;
 
             var words = text.Split(' ', StringSplitOptions.RemoveEmptyEntries);
-            var processedWords = new List<string>(words.Length);
 
-            foreach (var word in words)
-            {
-                if (string.IsNullOrEmpty(word))
-                {
-                    processedWords.Add(word);
-                    continue;
-                }
+            // Only Russian text rewrites words; otherwise the split/join just normalizes spacing
+            if (!primaryLanguage.StartsWith("ru", StringComparison.OrdinalIgnoreCase))
+                return string.Join(" ", words);
 
-                bool hasCyrillic = word.Any(c => c >= '\u0400' && c <= '\u04FF');
-                bool hasLatin = word.Any(c => (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z'));
+            for (int i = 0; i < words.Length; i++)
+            {
+                var word = words[i];
+                int cyrillicCount = 0;
+                int latinCount = 0;
 
-                if (hasCyrillic && hasLatin)
+                foreach (char c in word)
                 {
-                    int cyrillicCount = word.Count(c => c >= '\u0400' && c <= '\u04FF');
-                    int latinCount = word.Count(c => (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z'));
-
-                    if (primaryLanguage.StartsWith("ru", StringComparison.OrdinalIgnoreCase))
-                    {
-                        if (latinCount > cyrillicCount && !IsLikelyTechnicalTerm(word))
-                        {
-                            processedWords.Add(TransliterateLatinToCyrillic(word));
-                        }
-                        else
-                        {
-                            processedWords.Add(word);
-                        }
-                    }
-                    else
-                    {
-                        processedWords.Add(word);
-                    }
+                    if (IsCyrillic(c))
+                        cyrillicCount++;
+                    else if (IsLatin(c))
+                        latinCount++;
                 }
-                else
+
+                if (cyrillicCount > 0 && latinCount > cyrillicCount && !IsLikelyTechnicalTerm(word))
                 {
-                    processedWords.Add(word);
+                    words[i] = TransliterateLatinToCyrillic(word);
                 }
             }
 
-            return string.Join(" ", processedWords);
+            return string.Join(" ", words);
         }
 
         public static string FormatRecognizedText(string text)
@@ -145,10 +145,13 @@ namespace VoiceDictation.Core.Utils
             if (string.IsNullOrEmpty(text))
                 return text;
 
-            var sentenceRegex = new Regex(@"(^|[.!?]\s+)([a-zа-яё])", RegexOptions.Compiled);
-            text = sentenceRegex.Replace(text, m => m.Groups[1].Value + m.Groups[2].Value.ToUpperInvariant());
+            text = SentenceStartRegex().Replace(text, m => m.Groups[1].Value + m.Groups[2].Value.ToUpperInvariant());
 
             return text;
         }
+
+        private static bool IsCyrillic(char c) => c >= '\u0400' && c <= '\u04FF';
+
+        private static bool IsLatin(char c) => (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z');
     }
 } 
\ No newline at end of file
@@ -23,6 +23,8 @@ namespace VoiceDictation.Network.Proxy
         private string? _configFilePath;
         private readonly HttpClient _httpClient;
         
+        private static readonly JsonSerializer ConfigSerializer = new JsonSerializer { Formatting = Formatting.Indented };
+        
         public event EventHandler<ProxyStatusChangedEventArgs>? StatusChanged;
         public bool IsProxyActive => _currentProxy != null;
         public ProxyConfig? CurrentProxy => _currentProxy;
@@ -317,14 +319,7 @@ namespace VoiceDictation.Network.Proxy
                         return new List<ProxyConfig>();
                     }
                     
-                    string json = File.ReadAllText(configPath);
-                    
-                    if (string.IsNullOrEmpty(json))
-                    {
-                        return new List<ProxyConfig>();
-                    }
-                    
-                    var config = JsonConvert.DeserializeObject<ProxyConfigFile>(json);
+                    var config = ReadConfigFile(configPath);
                     
                     return config?.Proxies ?? new List<ProxyConfig>();
                 });
@@ -371,8 +366,11 @@ namespace VoiceDictation.Network.Proxy
                     Proxies = _proxies.Values.ToList()
                 };
                 
-                var json = JsonConvert.SerializeObject(config, Formatting.Indented);
-                await File.WriteAllTextAsync(filePath, json);
+                // Newtonsoft.Json has no async serializer, so build the (small) document in memory and
+                // hand it to a fully asynchronous file write
+                var json = new StringWriter();
+                ConfigSerializer.Serialize(json, config);
+                await File.WriteAllTextAsync(filePath, json.ToString());
                 
                 _configFilePath = filePath;
                 
@@ -546,6 +544,16 @@ namespace VoiceDictation.Network.Proxy
         {
             public List<ProxyConfig> Proxies { get; set; } = new List<ProxyConfig>();
         }
+        
+        /// <summary>
+        /// Deserializes a configuration file straight from disk without buffering it into a string
+        /// </summary>
+        private static ProxyConfigFile? ReadConfigFile(string filePath)
+        {
+            using var reader = File.OpenText(filePath);
+            using var jsonReader = new JsonTextReader(reader);
+            return ConfigSerializer.Deserialize<ProxyConfigFile>(jsonReader);
+        }
 
         /// <summary>
         /// Loads proxy configuration from file
@@ -563,7 +571,7 @@ namespace VoiceDictation.Network.Proxy
                 }
                 
                 // Добавляем таймаут для защиты от зависаний
-                var loadFileTask = Task.Run(async () => await File.ReadAllTextAsync(filePath));
+                var loadFileTask = Task.Run(() => ReadConfigFile(filePath));
                 var timeoutTask = Task.Delay(5000); // 5 секунд таймаут
                 
                 var completedTask = await Task.WhenAny(loadFileTask, timeoutTask);
@@ -575,9 +583,7 @@ namespace VoiceDictation.Network.Proxy
                     return false;
                 }
                 
-                var json = await loadFileTask;
-                
-                var config = JsonConvert.DeserializeObject<ProxyConfigFile>(json);
+                var config = await loadFileTask;
                 
                 if (config == null || config.Proxies == null)
                 {
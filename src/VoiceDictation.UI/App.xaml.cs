@@ -24,12 +24,19 @@ namespace VoiceDictation.UI
         /// </summary>
         public ServiceProvider ServiceProvider => _serviceProvider;
         
+        /// <summary>
+        /// Gets the directory containing the bundled Python modules
+        /// </summary>
+        public static string PythonModulesPath { get; } = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "PythonModules");
+        
+        private static readonly string LogFilePath = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "logs", "voice_dictation-.log");
+        
         public App()
         {
             Log.Logger = new LoggerConfiguration()
                 .MinimumLevel.Information()
                 .WriteTo.Console()
-                .WriteTo.File("logs/voice_dictation-.log", rollingInterval: RollingInterval.Day)
+                .WriteTo.Async(sink => sink.File(LogFilePath, rollingInterval: RollingInterval.Day))
                 .CreateLogger();
             
             var services = new ServiceCollection();
@@ -62,9 +69,7 @@ namespace VoiceDictation.UI
             services.AddTransient<PythonSpeechRecognizer>(provider => 
             {
                 var logger = provider.GetRequiredService<ILogger<PythonSpeechRecognizer>>();
-                var pythonModulesPath = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "PythonModules");
-                
-                return new PythonSpeechRecognizer(logger, pythonModulesPath);
+                return new PythonSpeechRecognizer(logger, PythonModulesPath);
             });
             
             services.AddTransient<ISpeechRecognizer>(provider => 
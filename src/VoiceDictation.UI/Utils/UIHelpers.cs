@@ -30,6 +30,18 @@ namespace VoiceDictation.UI.Utils
             return Application.Current.Dispatcher.InvokeAsync(action);
         }
 
+        public static void RunOnUIThreadNonBlocking(Action action)
+        {
+            if (Application.Current.Dispatcher.CheckAccess())
+            {
+                action();
+            }
+            else
+            {
+                Application.Current.Dispatcher.InvokeAsync(action);
+            }
+        }
+
         public static void SetWaitCursor()
         {
             RunOnUIThread(() => Mouse.OverrideCursor = Cursors.Wait);
@@ -248,7 +248,7 @@ namespace VoiceDictation.UI.ViewModels
             {
                 _textOperations.HandleRecognitionResult(e.Result);
                 
-                Application.Current.Dispatcher.Invoke(() =>
+                UIHelpers.RunOnUIThreadNonBlocking(() =>
                 {
                     StatusMessage = "Распознано: " + e.Result.Text;
                 });
@@ -257,23 +257,23 @@ namespace VoiceDictation.UI.ViewModels
         
         private void SpeechRecognizer_SpeechError(object? sender, SpeechErrorEventArgs e)
         {
-            UIHelpers.SafeExecute(() =>
-            {
-            Application.Current.Dispatcher.Invoke(() =>
+            UIHelpers.RunOnUIThreadNonBlocking(() =>
             {
-                StatusMessage = $"Ошибка распознавания: {e.ErrorMessage}";
+                UIHelpers.SafeExecute(() =>
+                {
+                    StatusMessage = $"Ошибка распознавания: {e.ErrorMessage}";
+                }, _logger, "Error handling speech error event");
             });
-            }, _logger, "Error handling speech error event");
         }
         
         private void SpeechRecognizer_StatusChanged(object? sender, SpeechStatusChangedEventArgs e)
         {
-            UIHelpers.SafeExecute(() =>
+            UIHelpers.RunOnUIThreadNonBlocking(() =>
             {
-            Application.Current.Dispatcher.Invoke(() =>
-            {
-                switch (e.Status)
+                UIHelpers.SafeExecute(() =>
                 {
+                    switch (e.Status)
+                    {
                         case SpeechRecognitionStatus.Initializing:
                             StatusMessage = "Инициализация...";
                             break;
@@ -281,21 +281,21 @@ namespace VoiceDictation.UI.ViewModels
                             StatusMessage = "Готов к работе";
                             RecognitionProgress = 0;
                             break;
-                    case SpeechRecognitionStatus.Listening:
+                        case SpeechRecognitionStatus.Listening:
                             StatusMessage = $"Слушаю...";
-                        break;
-                    case SpeechRecognitionStatus.Processing:
-                        StatusMessage = "Обработка...";
-                        break;
-                    case SpeechRecognitionStatus.Recognized:
+                            break;
+                        case SpeechRecognitionStatus.Processing:
+                            StatusMessage = "Обработка...";
+                            break;
+                        case SpeechRecognitionStatus.Recognized:
                             StatusMessage = "Распознано";
-                        break;
-                    case SpeechRecognitionStatus.Error:
+                            break;
+                        case SpeechRecognitionStatus.Error:
                             StatusMessage = "Ошибка распознавания";
-                        break;
-                }
-                });
-            }, _logger, "Error handling speech status changed event");
+                            break;
+                    }
+                }, _logger, "Error handling speech status changed event");
+            });
         }
         
         private async void ProcessAudioFile()
@@ -2,6 +2,7 @@ using System;
 using System.Collections.ObjectModel;
 using System.Linq;
 using System.Threading.Tasks;
+using System.Windows.Threading;
 using CommunityToolkit.Mvvm.ComponentModel;
 using Microsoft.Extensions.Logging;
 using VoiceDictation.Core.SpeechRecognition;
@@ -21,7 +22,7 @@ namespace VoiceDictation.UI.ViewModels
         
         private bool _isRecording;
         private DateTime _recordingStartTime;
-        private System.Timers.Timer? _recordingTimer;
+        private DispatcherTimer? _recordingTimer;
         private int _recordingDuration = 10;
         private string _recordingTimeDisplay = "00:00";
         private LanguageViewModel? _selectedLanguage;
@@ -77,8 +78,11 @@ namespace VoiceDictation.UI.ViewModels
             _setStatusMessage = setStatusMessage;
             _setRecognitionProgress = setRecognitionProgress;
             
-            _recordingTimer = new System.Timers.Timer(1000);
-            _recordingTimer.Elapsed += (s, e) => UpdateRecordingTime();
+            _recordingTimer = new DispatcherTimer(DispatcherPriority.Background)
+            {
+                Interval = TimeSpan.FromSeconds(1)
+            };
+            _recordingTimer.Tick += (s, e) => UpdateRecordingTime();
         }
         
         /// <summary>
@@ -162,16 +166,13 @@ namespace VoiceDictation.UI.ViewModels
             {
                 var elapsed = DateTime.Now - _recordingStartTime;
                 
-                System.Windows.Application.Current.Dispatcher.Invoke(() =>
+                RecordingTimeDisplay = $"{elapsed.Minutes:00}:{elapsed.Seconds:00}";
+                
+                if (RecordingDuration > 0)
                 {
-                    RecordingTimeDisplay = $"{elapsed.Minutes:00}:{elapsed.Seconds:00}";
-                    
-                    if (RecordingDuration > 0)
-                    {
-                        double progress = (elapsed.TotalSeconds % RecordingDuration) / RecordingDuration * 100;
-                        _setRecognitionProgress(progress);
-                    }
-                });
+                    double progress = (elapsed.TotalSeconds % RecordingDuration) / RecordingDuration * 100;
+                    _setRecognitionProgress(progress);
+                }
             }
         }
     
@@ -188,7 +189,7 @@ namespace VoiceDictation.UI.ViewModels
                 StopRecognitionAsync().Wait();
             }
             
-            _recordingTimer?.Dispose();
+            _recordingTimer?.Stop();
             _recordingTimer = null;
         }
     }
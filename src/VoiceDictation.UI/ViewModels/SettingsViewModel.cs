@@ -12,7 +12,6 @@ using Microsoft.Extensions.Logging;
 using VoiceDictation.Core.SpeechRecognition;
 using VoiceDictation.Network.Proxy;
 using VoiceDictation.UI.Models;
-using System.IO;
 
 namespace VoiceDictation.UI.ViewModels
 {
@@ -589,8 +588,7 @@ namespace VoiceDictation.UI.ViewModels
                         {
                             var loggerFactory = ((App)Application.Current).ServiceProvider.GetRequiredService<ILoggerFactory>();
                             var pyLogger = loggerFactory.CreateLogger<PythonSpeechRecognizer>();
-                            var pythonModulesPath = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "PythonModules");
-                            newRecognizer = new PythonSpeechRecognizer(pyLogger, pythonModulesPath);
+                            newRecognizer = new PythonSpeechRecognizer(pyLogger, App.PythonModulesPath);
                         }
                         
                         if (newRecognizer == null)
@@ -138,7 +138,7 @@ namespace VoiceDictation.UI.ViewModels
         /// <returns>Processed text</returns>
         public string ProcessRecognizedText(string text)
         {
-            if (string.IsNullOrEmpty(text))
+            if (string.IsNullOrWhiteSpace(text))
                 return text;
                 
             if (AutoFormatting)
@@ -165,6 +165,11 @@ namespace VoiceDictation.UI.ViewModels
                 return false;
             
             string newText = ProcessRecognizedText(result.Text);
+            
+            // Nothing to append; skip rebuilding (and re-rendering) the whole transcript
+            if (string.IsNullOrWhiteSpace(newText))
+                return true;
+            
             string existingText = _getRecognizedText();
             
             if (!string.IsNullOrEmpty(existingText))